@@ -255,7 +255,8 @@ class ArrowSeries(EagerSeries["ArrowChunkedArray"]):
         return self._with_native(pc.subtract(ser, other))
 
     def __rsub__(self, other: Any) -> Self:
-        return (self - other) * (-1)
+        ser, other = extract_native(self, other)
+        return self._with_native(pc.subtract(other, ser))
 
     def __mul__(self, other: Any) -> Self:
         ser, other = extract_native(self, other)
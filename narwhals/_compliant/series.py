@@ -66,6 +66,8 @@ class CompliantSeries(
     FromNative[NativeSeriesT],
     Protocol[NativeSeriesT],
 ):
+    __slots__ = ()
+
     _implementation: Implementation
     _backend_version: tuple[int, ...]
     _version: Version
@@ -292,6 +294,8 @@ class CompliantSeries(
 
 
 class EagerSeries(CompliantSeries[NativeSeriesT], Protocol[NativeSeriesT]):
+    __slots__ = ()
+
     _native_series: Any
     _implementation: Implementation
     _backend_version: tuple[int, ...]
@@ -220,10 +220,10 @@ class PandasLikeDataFrame(
         return self
 
     def __narwhals_namespace__(self) -> PandasLikeNamespace:
-        from narwhals._pandas_like.namespace import PandasLikeNamespace
+        from narwhals._pandas_like.namespace import cached_namespace
 
-        return PandasLikeNamespace(
-            self._implementation, self._backend_version, version=self._version
+        return cached_namespace(
+            self._implementation, self._backend_version, self._version
         )
 
     def __native_namespace__(self) -> ModuleType:
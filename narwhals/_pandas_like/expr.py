@@ -96,10 +96,10 @@ class PandasLikeExpr(EagerExpr["PandasLikeDataFrame", PandasLikeSeries]):
         self._metadata: ExprMetadata | None = None
 
     def __narwhals_namespace__(self) -> PandasLikeNamespace:
-        from narwhals._pandas_like.namespace import PandasLikeNamespace
+        from narwhals._pandas_like.namespace import cached_namespace
 
-        return PandasLikeNamespace(
-            self._implementation, self._backend_version, version=self._version
+        return cached_namespace(
+            self._implementation, self._backend_version, self._version
         )
 
     def __narwhals_expr__(self) -> None: ...
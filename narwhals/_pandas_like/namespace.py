@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import operator
 import warnings
+from functools import lru_cache
 from functools import reduce
 from typing import TYPE_CHECKING
 from typing import Any
@@ -324,6 +325,20 @@ class PandasLikeNamespace(
         )
 
 
+@lru_cache(maxsize=16)
+def cached_namespace(
+    implementation: Implementation,
+    backend_version: tuple[int, ...],
+    version: Version,
+) -> PandasLikeNamespace:
+    """Return a shared `PandasLikeNamespace` for the given context.
+
+    Namespaces hold no state beyond these three values, so series, frames and
+    expressions can reuse one instance rather than building a new one per call.
+    """
+    return PandasLikeNamespace(implementation, backend_version, version)
+
+
 class PandasWhen(
     EagerWhen[PandasLikeDataFrame, PandasLikeSeries, PandasLikeExpr, "pd.Series[Any]"]
 ):
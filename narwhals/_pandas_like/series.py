@@ -1,7 +1,10 @@
 from __future__ import annotations
 
+import operator
+from functools import partial
 from typing import TYPE_CHECKING
 from typing import Any
+from typing import Callable
 from typing import Iterable
 from typing import Iterator
 from typing import Mapping
@@ -105,8 +108,23 @@ PANDAS_TO_NUMPY_DTYPE_MISSING = {
     "float32[pyarrow]": "float32",
 }
 
+# Plain scalars never need aligning, so binary operations can skip
+# `align_and_extract_native` for them.
+_SCALAR_TYPES = frozenset(
+    (bool, int, float, str, np.bool_, np.int32, np.int64, np.float32, np.float64)
+)
+
 
 class PandasLikeSeries(EagerSeries[Any]):
+    __slots__ = (
+        "_backend_version",
+        "_broadcast",
+        "_implementation",
+        "_name",
+        "_native_series",
+        "_version",
+    )
+
     def __init__(
         self,
         native_series: Any,
@@ -140,9 +158,9 @@ class PandasLikeSeries(EagerSeries[Any]):
         raise AssertionError(msg)
 
     def __narwhals_namespace__(self) -> PandasLikeNamespace:
-        from narwhals._pandas_like.namespace import PandasLikeNamespace
+        from narwhals._pandas_like.namespace import cached_namespace
 
-        return PandasLikeNamespace(
+        return cached_namespace(
             self._implementation, self._backend_version, self._version
         )
 
@@ -164,14 +182,15 @@ class PandasLikeSeries(EagerSeries[Any]):
         )
 
     def _with_native(self, series: Any, *, preserve_broadcast: bool = False) -> Self:
-        result = self.__class__(
-            series,
-            implementation=self._implementation,
-            backend_version=self._backend_version,
-            version=self._version,
-        )
-        if preserve_broadcast:
-            result._broadcast = self._broadcast
+        # The backend was already validated when `self` was created, so skip
+        # `__init__`: this runs for nearly every operation.
+        result = object.__new__(self.__class__)
+        result._name = series.name
+        result._native_series = series
+        result._implementation = self._implementation
+        result._backend_version = self._backend_version
+        result._version = self._version
+        result._broadcast = self._broadcast if preserve_broadcast else False
         return result
 
     @classmethod
@@ -379,105 +398,99 @@ class PandasLikeSeries(EagerSeries[Any]):
             _, other_native = align_and_extract_native(self, predicate)
         else:
             other_native = predicate
-        return self._with_native(self.native.loc[other_native]).alias(self.name)
+        return self._with_native(self.native.loc[other_native])
 
-    def __eq__(self, other: object) -> PandasLikeSeries:  # type: ignore[override]
-        ser, other = align_and_extract_native(self, other)
-        return self._with_native(ser == other).alias(self.name)
+    def _binary_op(
+        self, op: Callable[[Any, Any], Any], other: Any, *, reflect: bool = False
+    ) -> Self:
+        # Read the backing attributes directly: this runs for every operator call.
+        native = self._native_series
+        if type(other) in _SCALAR_TYPES:
+            ser, other_native = native, other
+        else:
+            ser, other_native = align_and_extract_native(self, other)
+        result = op(other_native, ser) if reflect else op(ser, other_native)
+        if result.name != self._name:
+            # pandas drops the name when both operands are named differently.
+            result = rename(
+                result,
+                self._name,
+                implementation=self._implementation,
+                backend_version=self._backend_version,
+            )
+        return self._with_native(result)
+
+    def __eq__(self, other: object) -> Self:  # type: ignore[override]
+        return self._binary_op(operator.eq, other)
 
-    def __ne__(self, other: object) -> PandasLikeSeries:  # type: ignore[override]
-        ser, other = align_and_extract_native(self, other)
-        return self._with_native(ser != other).alias(self.name)
+    def __ne__(self, other: object) -> Self:  # type: ignore[override]
+        return self._binary_op(operator.ne, other)
 
-    def __ge__(self, other: Any) -> PandasLikeSeries:
-        ser, other = align_and_extract_native(self, other)
-        return self._with_native(ser >= other).alias(self.name)
+    def __ge__(self, other: Any) -> Self:
+        return self._binary_op(operator.ge, other)
 
-    def __gt__(self, other: Any) -> PandasLikeSeries:
-        ser, other = align_and_extract_native(self, other)
-        return self._with_native(ser > other).alias(self.name)
+    def __gt__(self, other: Any) -> Self:
+        return self._binary_op(operator.gt, other)
 
-    def __le__(self, other: Any) -> PandasLikeSeries:
-        ser, other = align_and_extract_native(self, other)
-        return self._with_native(ser <= other).alias(self.name)
+    def __le__(self, other: Any) -> Self:
+        return self._binary_op(operator.le, other)
 
-    def __lt__(self, other: Any) -> PandasLikeSeries:
-        ser, other = align_and_extract_native(self, other)
-        return self._with_native(ser < other).alias(self.name)
+    def __lt__(self, other: Any) -> Self:
+        return self._binary_op(operator.lt, other)
 
-    def __and__(self, other: Any) -> PandasLikeSeries:
-        ser, other = align_and_extract_native(self, other)
-        return self._with_native(ser & other).alias(self.name)
+    def __and__(self, other: Any) -> Self:
+        return self._binary_op(operator.and_, other)
 
-    def __rand__(self, other: Any) -> PandasLikeSeries:
-        ser, other = align_and_extract_native(self, other)
-        ser = cast("pd.Series[Any]", ser)
-        return self._with_native(ser.__and__(other)).alias(self.name)
+    def __rand__(self, other: Any) -> Self:
+        return self._binary_op(operator.and_, other)
 
-    def __or__(self, other: Any) -> PandasLikeSeries:
-        ser, other = align_and_extract_native(self, other)
-        return self._with_native(ser | other).alias(self.name)
+    def __or__(self, other: Any) -> Self:
+        return self._binary_op(operator.or_, other)
 
-    def __ror__(self, other: Any) -> PandasLikeSeries:
-        ser, other = align_and_extract_native(self, other)
-        ser = cast("pd.Series[Any]", ser)
-        return self._with_native(ser.__or__(other)).alias(self.name)
+    def __ror__(self, other: Any) -> Self:
+        return self._binary_op(operator.or_, other)
 
-    def __add__(self, other: Any) -> PandasLikeSeries:
-        ser, other = align_and_extract_native(self, other)
-        return self._with_native(ser + other).alias(self.name)
+    def __add__(self, other: Any) -> Self:
+        return self._binary_op(operator.add, other)
 
-    def __radd__(self, other: Any) -> PandasLikeSeries:
-        _, other_native = align_and_extract_native(self, other)
-        return self._with_native(self.native.__radd__(other_native)).alias(self.name)
+    def __radd__(self, other: Any) -> Self:
+        return self._binary_op(operator.add, other, reflect=True)
 
-    def __sub__(self, other: Any) -> PandasLikeSeries:
-        ser, other = align_and_extract_native(self, other)
-        return self._with_native(ser - other).alias(self.name)
+    def __sub__(self, other: Any) -> Self:
+        return self._binary_op(operator.sub, other)
 
-    def __rsub__(self, other: Any) -> PandasLikeSeries:
-        _, other_native = align_and_extract_native(self, other)
-        return self._with_native(self.native.__rsub__(other_native)).alias(self.name)
+    def __rsub__(self, other: Any) -> Self:
+        return self._binary_op(operator.sub, other, reflect=True)
 
-    def __mul__(self, other: Any) -> PandasLikeSeries:
-        ser, other = align_and_extract_native(self, other)
-        return self._with_native(ser * other).alias(self.name)
+    def __mul__(self, other: Any) -> Self:
+        return self._binary_op(operator.mul, other)
 
-    def __rmul__(self, other: Any) -> PandasLikeSeries:
-        _, other_native = align_and_extract_native(self, other)
-        return self._with_native(self.native.__rmul__(other_native)).alias(self.name)
+    def __rmul__(self, other: Any) -> Self:
+        return self._binary_op(operator.mul, other, reflect=True)
 
-    def __truediv__(self, other: Any) -> PandasLikeSeries:
-        ser, other = align_and_extract_native(self, other)
-        return self._with_native(ser / other).alias(self.name)
+    def __truediv__(self, other: Any) -> Self:
+        return self._binary_op(operator.truediv, other)
 
-    def __rtruediv__(self, other: Any) -> PandasLikeSeries:
-        _, other_native = align_and_extract_native(self, other)
-        return self._with_native(self.native.__rtruediv__(other_native)).alias(self.name)
+    def __rtruediv__(self, other: Any) -> Self:
+        return self._binary_op(operator.truediv, other, reflect=True)
 
-    def __floordiv__(self, other: Any) -> PandasLikeSeries:
-        ser, other = align_and_extract_native(self, other)
-        return self._with_native(ser // other).alias(self.name)
+    def __floordiv__(self, other: Any) -> Self:
+        return self._binary_op(operator.floordiv, other)
 
-    def __rfloordiv__(self, other: Any) -> PandasLikeSeries:
-        _, other_native = align_and_extract_native(self, other)
-        return self._with_native(self.native.__rfloordiv__(other_native)).alias(self.name)
+    def __rfloordiv__(self, other: Any) -> Self:
+        return self._binary_op(operator.floordiv, other, reflect=True)
 
-    def __pow__(self, other: Any) -> PandasLikeSeries:
-        ser, other = align_and_extract_native(self, other)
-        return self._with_native(ser**other).alias(self.name)
+    def __pow__(self, other: Any) -> Self:
+        return self._binary_op(operator.pow, other)
 
-    def __rpow__(self, other: Any) -> PandasLikeSeries:
-        _, other_native = align_and_extract_native(self, other)
-        return self._with_native(self.native.__rpow__(other_native)).alias(self.name)
+    def __rpow__(self, other: Any) -> Self:
+        return self._binary_op(operator.pow, other, reflect=True)
 
-    def __mod__(self, other: Any) -> PandasLikeSeries:
-        ser, other = align_and_extract_native(self, other)
-        return self._with_native(ser % other).alias(self.name)
+    def __mod__(self, other: Any) -> Self:
+        return self._binary_op(operator.mod, other)
 
-    def __rmod__(self, other: Any) -> PandasLikeSeries:
-        _, other_native = align_and_extract_native(self, other)
-        return self._with_native(self.native.__rmod__(other_native)).alias(self.name)
+    def __rmod__(self, other: Any) -> Self:
+        return self._binary_op(operator.mod, other, reflect=True)
 
     # Unary
 
@@ -486,32 +499,52 @@ class PandasLikeSeries(EagerSeries[Any]):
 
     # Reductions
 
+    def _reduce(self, method: str, np_func: Callable[[Any], Any]) -> Any:
+        native = self.native
+        dtype = native.dtype
+        if (
+            self._implementation is Implementation.PANDAS
+            and isinstance(dtype, np.dtype)
+            and dtype.kind in "biuf"
+            and len(native)
+        ):
+            values = native.to_numpy()
+            if dtype.kind != "f" or not np.isnan(values).any():
+                # Nothing to skip, so reduce the NumPy values directly and avoid
+                # pandas' missing-value handling.
+                return np_func(values)
+        return getattr(native, method)()
+
     def any(self) -> bool:
-        return self.native.any()
+        return self._reduce("any", np.any)
 
     def all(self) -> bool:
-        return self.native.all()
+        return self._reduce("all", np.all)
 
     def min(self) -> Any:
-        return self.native.min()
+        return self._reduce("min", np.min)
 
     def max(self) -> Any:
-        return self.native.max()
+        return self._reduce("max", np.max)
 
     def sum(self) -> float:
-        return self.native.sum()
+        # Like pandas, sum small ints and bools in 64 bits rather than in the
+        # platform default integer, which is 32 bits on Windows with NumPy 1.x.
+        kind = self.native.dtype.kind
+        acc_dtype = np.uint64 if kind == "u" else np.int64 if kind in "bi" else None
+        return self._reduce("sum", partial(np.sum, dtype=acc_dtype))
 
     def count(self) -> int:
         return self.native.count()
 
     def mean(self) -> float:
-        return self.native.mean()
+        return self._reduce("mean", np.mean)
 
     def median(self) -> float:
         if not self.dtype.is_numeric():
             msg = "`median` operation not supported for non-numeric input type."
             raise InvalidOperationError(msg)
-        return self.native.median()
+        return self._reduce("median", np.median)
 
     def std(self, *, ddof: int) -> float:
         return self.native.std(ddof=ddof)
@@ -544,6 +577,20 @@ class PandasLikeSeries(EagerSeries[Any]):
     def is_nan(self) -> PandasLikeSeries:
         ser = self.native
         if self.dtype.is_numeric():
+            arr = ser.array
+            if (
+                self._implementation is Implementation.PANDAS
+                and self._backend_version >= (1,)
+                and hasattr(arr, "_mask")
+            ):
+                # Masked (nullable) array: check the raw values directly and
+                # reuse the null mask, instead of a masked `!=` comparison.
+                # `BooleanArray` only exists from pandas 1.0.
+                result_arr = self.__native_namespace__().arrays.BooleanArray(
+                    np.isnan(arr._data), arr._mask.copy()
+                )
+                result = ser.__class__(result_arr, index=ser.index, name=ser.name)
+                return self._with_native(result, preserve_broadcast=True)
             return self._with_native(ser != ser, preserve_broadcast=True)  # noqa: PLR0124
         msg = f"`.is_nan` only supported for numeric dtype and not {self.dtype}, did you mean `.is_null`?"
         raise InvalidOperationError(msg)
@@ -593,14 +640,30 @@ class PandasLikeSeries(EagerSeries[Any]):
     def abs(self) -> PandasLikeSeries:
         return self._with_native(self.native.abs())
 
-    def cum_sum(self, *, reverse: bool) -> Self:
-        result = (
-            self.native.cumsum(skipna=True)
-            if not reverse
-            else self.native[::-1].cumsum(skipna=True)[::-1]
-        )
+    def _cumulative(
+        self, method: str, np_func: Callable[[Any], Any], *, reverse: bool
+    ) -> Self:
+        native = self.native
+        dtype = native.dtype
+        if (
+            self._implementation is Implementation.PANDAS
+            and isinstance(dtype, np.dtype)
+            and dtype.kind == "f"
+            and not np.isnan(values := native.to_numpy()).any()
+        ):
+            # Without NaNs there is nothing for pandas to mask, so accumulate the
+            # floats directly. Ints and bools already go straight to NumPy.
+            result_values = np_func(values[::-1])[::-1] if reverse else np_func(values)
+            result = type(native)(result_values, index=native.index, name=native.name)
+        elif reverse:
+            result = getattr(native[::-1], method)(skipna=True)[::-1]
+        else:
+            result = getattr(native, method)(skipna=True)
         return self._with_native(result)
 
+    def cum_sum(self, *, reverse: bool) -> Self:
+        return self._cumulative("cumsum", np.cumsum, reverse=reverse)
+
     def unique(self, *, maintain_order: bool) -> PandasLikeSeries:
         # pandas always maintains order, as per its docstring:
         # "Uniques are returned in order of appearance"  # noqa: ERA001
@@ -653,10 +716,10 @@ class PandasLikeSeries(EagerSeries[Any]):
         na_position = "last" if nulls_last else "first"
         return self._with_native(
             self.native.sort_values(ascending=not descending, na_position=na_position)
-        ).alias(self.name)
+        )
 
     def alias(self, name: str | Hashable) -> Self:
-        if name != self.name:
+        if name != self._name:
             return self._with_native(
                 rename(
                     self.native,
@@ -678,23 +741,28 @@ class PandasLikeSeries(EagerSeries[Any]):
         # the default is meant to be None, but pandas doesn't allow it?
         # https://numpy.org/doc/stable/reference/generated/numpy.ndarray.__array__.html
         dtypes = self._version.dtypes
-        if isinstance(self.dtype, dtypes.Datetime) and self.dtype.time_zone is not None:
+        nw_dtype = self.dtype
+        if isinstance(nw_dtype, dtypes.Datetime) and nw_dtype.time_zone is not None:
             s = self.dt.convert_time_zone("UTC").dt.replace_time_zone(None).native
         else:
             s = self.native
 
-        has_missing = s.isna().any()
         kwargs: dict[Any, Any] = {"copy": copy or self._implementation.is_cudf()}
-        if has_missing and str(s.dtype) in PANDAS_TO_NUMPY_DTYPE_MISSING:
-            if self._implementation is Implementation.PANDAS and self._backend_version < (
-                1,
-            ):  # pragma: no cover
-                ...
+        native_dtype = str(s.dtype)
+        # Only nullable dtypes need special-casing, so we can skip the
+        # `isna` pass entirely for NumPy-backed Series.
+        if native_dtype in PANDAS_TO_NUMPY_DTYPE_NO_MISSING:
+            if s.isna().any():
+                if (
+                    self._implementation is Implementation.PANDAS
+                    and self._backend_version < (1,)
+                ):  # pragma: no cover
+                    ...
+                else:
+                    kwargs.update({"na_value": float("nan")})
+                dtype = dtype or PANDAS_TO_NUMPY_DTYPE_MISSING[native_dtype]
             else:
-                kwargs.update({"na_value": float("nan")})
-            dtype = dtype or PANDAS_TO_NUMPY_DTYPE_MISSING[str(s.dtype)]
-        if not has_missing and str(s.dtype) in PANDAS_TO_NUMPY_DTYPE_NO_MISSING:
-            dtype = dtype or PANDAS_TO_NUMPY_DTYPE_NO_MISSING[str(s.dtype)]
+                dtype = dtype or PANDAS_TO_NUMPY_DTYPE_NO_MISSING[native_dtype]
         return s.to_numpy(dtype=dtype, **kwargs)
 
     def to_pandas(self) -> pd.Series[Any]:
@@ -847,28 +915,13 @@ class PandasLikeSeries(EagerSeries[Any]):
         return self._with_native(result)
 
     def cum_min(self, *, reverse: bool) -> Self:
-        result = (
-            self.native.cummin(skipna=True)
-            if not reverse
-            else self.native[::-1].cummin(skipna=True)[::-1]
-        )
-        return self._with_native(result)
+        return self._cumulative("cummin", np.minimum.accumulate, reverse=reverse)
 
     def cum_max(self, *, reverse: bool) -> Self:
-        result = (
-            self.native.cummax(skipna=True)
-            if not reverse
-            else self.native[::-1].cummax(skipna=True)[::-1]
-        )
-        return self._with_native(result)
+        return self._cumulative("cummax", np.maximum.accumulate, reverse=reverse)
 
     def cum_prod(self, *, reverse: bool) -> Self:
-        result = (
-            self.native.cumprod(skipna=True)
-            if not reverse
-            else self.native[::-1].cumprod(skipna=True)[::-1]
-        )
-        return self._with_native(result)
+        return self._cumulative("cumprod", np.cumprod, reverse=reverse)
 
     def rolling_sum(self, window_size: int, *, min_samples: int, center: bool) -> Self:
         result = self.native.rolling(
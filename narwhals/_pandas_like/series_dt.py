@@ -4,6 +4,8 @@ from typing import TYPE_CHECKING
 from typing import Any
 
 from narwhals._compliant.any_namespace import DateTimeNamespace
+from narwhals._pandas_like.utils import NANOSECONDS_PER_DAY
+from narwhals._pandas_like.utils import NANOSECONDS_PER_TIME_UNIT
 from narwhals._pandas_like.utils import PandasLikeSeriesNamespace
 from narwhals._pandas_like.utils import calculate_timestamp_date
 from narwhals._pandas_like.utils import calculate_timestamp_datetime
@@ -70,6 +72,17 @@ class PandasLikeSeriesDateTimeNamespace(
         return self.with_native(self.native.dt.microsecond)
 
     def nanosecond(self) -> PandasLikeSeries:
+        # Only on pandas 2+, where the accessors return int32 as well.
+        if (
+            self.backend_version >= (2,)
+            and (epoch := self._epoch_values(wall_clock=False)) is not None
+        ):
+            # Take the sub-second part of the epoch offsets in one pass, rather
+            # than combining the `microsecond` and `nanosecond` accessors.
+            values, ns_per_unit = epoch
+            return self._with_int32_values(
+                values % (1_000_000_000 // ns_per_unit) * ns_per_unit
+            )
         return self.microsecond() * 1_000 + self.native.dt.nanosecond
 
     def ordinal_day(self) -> PandasLikeSeries:
@@ -84,12 +97,47 @@ class PandasLikeSeriesDateTimeNamespace(
         )
 
     def weekday(self) -> PandasLikeSeries:
+        # Only on pandas 2+, where the accessor returns int32 as well.
+        if (
+            self.backend_version >= (2,)
+            and (epoch := self._epoch_values(wall_clock=True)) is not None
+        ):
+            # 1970-01-01 was a Thursday, i.e. ISO weekday 4.
+            values, ns_per_unit = epoch
+            days = values // (NANOSECONDS_PER_DAY // ns_per_unit)
+            return self._with_int32_values((days + 3) % 7 + 1)
         # Pandas is 0-6 while Polars is 1-7
         return self.with_native(self.native.dt.weekday) + 1
 
     def _is_pyarrow(self) -> bool:
         return is_pyarrow_dtype_backend(self.native.dtype, self.implementation)
 
+    def _epoch_values(self, *, wall_clock: bool) -> tuple[Any, int] | None:
+        """Return the int64 epoch offsets of a NumPy-backed pandas datetime Series.
+
+        Also returns how many nanoseconds one offset unit spans. If `wall_clock`
+        is set, time zone aware values are first converted to local time.
+        Returns `None` if the Series isn't backed by such values.
+        """
+        dtype = self.compliant.dtype
+        if not (
+            self.implementation.is_pandas()
+            and not self._is_pyarrow()
+            and isinstance(dtype, self.version.dtypes.Datetime)
+        ):
+            return None
+        s = self.native
+        if wall_clock and dtype.time_zone is not None:
+            s = s.dt.tz_localize(None)
+        return s.array.asi8, NANOSECONDS_PER_TIME_UNIT[dtype.time_unit]
+
+    def _with_int32_values(self, values: Any) -> PandasLikeSeries:
+        s = self.native
+        result = type(s)(values.astype("int32"), index=s.index, name=s.name)
+        if (mask_na := s.isna()).any():
+            result = result.where(~mask_na)
+        return self.with_native(result)
+
     def _get_total_seconds(self) -> Any:
         if hasattr(self.native.dt, "total_seconds"):
             return self.native.dt.total_seconds()
@@ -188,5 +236,6 @@ class PandasLikeSeriesDateTimeNamespace(
         else:
             msg = "Input should be either of Date or Datetime type"
             raise TypeError(msg)
-        result[mask_na] = None
+        if mask_na.any():
+            result[mask_na] = None
         return self.with_native(result)
@@ -89,6 +89,9 @@ PA_DURATION_RGX = r"""^
 $"""
 PATTERN_PA_DURATION = re.compile(PA_DURATION_RGX, re.VERBOSE)
 
+NANOSECONDS_PER_TIME_UNIT = {"ns": 1, "us": 1_000, "ms": 1_000_000, "s": 1_000_000_000}
+NANOSECONDS_PER_DAY = 86_400_000_000_000
+
 
 def align_and_extract_native(
     lhs: PandasLikeSeries, rhs: PandasLikeSeries | object
@@ -586,38 +589,17 @@ def int_dtype_mapper(dtype: Any) -> str:
 def calculate_timestamp_datetime(
     s: pd.Series[int], original_time_unit: str, time_unit: str
 ) -> pd.Series[int]:
-    if original_time_unit == "ns":
-        if time_unit == "ns":
-            result = s
-        elif time_unit == "us":
-            result = s // 1_000
-        else:
-            result = s // 1_000_000
-    elif original_time_unit == "us":
-        if time_unit == "ns":
-            result = s * 1_000
-        elif time_unit == "us":
-            result = s
-        else:
-            result = s // 1_000
-    elif original_time_unit == "ms":
-        if time_unit == "ns":
-            result = s * 1_000_000
-        elif time_unit == "us":
-            result = s * 1_000
-        else:
-            result = s
-    elif original_time_unit == "s":
-        if time_unit == "ns":
-            result = s * 1_000_000_000
-        elif time_unit == "us":
-            result = s * 1_000_000
-        else:
-            result = s * 1_000
-    else:  # pragma: no cover
+    if original_time_unit not in NANOSECONDS_PER_TIME_UNIT:  # pragma: no cover
         msg = f"unexpected time unit {original_time_unit}, please report a bug at https://github.com/narwhals-dev/narwhals"
         raise AssertionError(msg)
-    return result
+    # Rescale in a single integer operation on the epoch offsets.
+    from_ns = NANOSECONDS_PER_TIME_UNIT[original_time_unit]
+    to_ns = NANOSECONDS_PER_TIME_UNIT[time_unit]
+    if from_ns > to_ns:
+        return s * (from_ns // to_ns)
+    if from_ns < to_ns:
+        return s // (to_ns // from_ns)
+    return s
 
 
 def calculate_timestamp_date(s: pd.Series[int], time_unit: str) -> pd.Series[int]:
@@ -68,10 +68,14 @@ FromNumpyT_contra = TypeVar("FromNumpyT_contra", contravariant=True)
 
 
 class ToNumpy(Protocol[ToNumpyT_co]):
+    __slots__ = ()
+
     def to_numpy(self, *args: Any, **kwds: Any) -> ToNumpyT_co: ...
 
 
 class FromNumpy(Protocol[FromNumpyT_contra]):
+    __slots__ = ()
+
     @classmethod
     def from_numpy(cls, data: FromNumpyT_contra, *args: Any, **kwds: Any) -> Self: ...
 
@@ -81,6 +85,8 @@ class NumpyConvertible(
     FromNumpy[FromNumpyDT_contra],
     Protocol[ToNumpyT_co, FromNumpyDT_contra],
 ):
+    __slots__ = ()
+
     def to_numpy(self, dtype: Any, *, copy: bool | None) -> ToNumpyT_co: ...
 
 
@@ -88,6 +94,8 @@ FromIterableT_contra = TypeVar("FromIterableT_contra", contravariant=True, defau
 
 
 class FromIterable(Protocol[FromIterableT_contra]):
+    __slots__ = ()
+
     @classmethod
     def from_iterable(
         cls, data: Iterable[FromIterableT_contra], *args: Any, **kwds: Any
@@ -153,6 +161,8 @@ FromNativeT = TypeVar("FromNativeT")
 
 
 class FromNative(Protocol[FromNativeT]):
+    __slots__ = ()
+
     @classmethod
     def from_native(cls, data: FromNativeT, *args: Any, **kwds: Any) -> Self: ...
     @staticmethod
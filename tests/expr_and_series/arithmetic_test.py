@@ -341,6 +341,22 @@ def test_arithmetic_series_left_literal(
     assert_equal_data(result, {"literal": expected})
 
 
+@pytest.mark.parametrize(
+    ("attr", "expected"),
+    [
+        ("__radd__", [7, 8, 9]),
+        ("__rsub__", [-5, -4, -3]),
+        ("__rmul__", [6, 12, 18]),
+    ],
+)
+def test_right_arithmetic_broadcast_expr(
+    attr: str, expected: list[Any], constructor: Constructor
+) -> None:
+    df = nw.from_native(constructor({"a": [1, 2, 3]}))
+    result = df.select(getattr(nw.col("a").sum(), attr)(nw.col("a")).alias("b"))
+    assert_equal_data(result, {"b": expected})
+
+
 def test_std_broadcating(constructor: Constructor) -> None:
     if "duckdb" in str(constructor) and DUCKDB_VERSION < (1, 3):
         # `std(ddof=2)` fails for duckdb here
@@ -244,3 +244,24 @@ def test_cum_min_series(
         reverse_cum_min=df["a"].cum_min(reverse=True),
     )
     assert_equal_data(result, expected)
+
+
+def test_cum_min_series_float_no_nulls(
+    request: pytest.FixtureRequest, constructor_eager: ConstructorEager
+) -> None:
+    if PYARROW_VERSION < (13, 0, 0) and "pyarrow_table" in str(constructor_eager):
+        request.applymarker(pytest.mark.xfail)
+
+    if (PANDAS_VERSION < (2, 1) or PYARROW_VERSION < (13,)) and "pandas_pyarrow" in str(
+        constructor_eager
+    ):
+        request.applymarker(pytest.mark.xfail)
+
+    data = {"a": [1.5, 3.0, 0.5, 2.0]}
+    df = nw.from_native(constructor_eager(data), eager_only=True)
+    result = df.select(
+        cum_min=df["a"].cum_min(),
+        reverse_cum_min=df["a"].cum_min(reverse=True),
+    )
+    expected = {"cum_min": [1.5, 1.5, 0.5, 0.5], "reverse_cum_min": [0.5, 0.5, 0.5, 2.0]}
+    assert_equal_data(result, expected)
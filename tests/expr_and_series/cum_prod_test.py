@@ -59,6 +59,30 @@ def test_cum_prod_series(
     assert_equal_data(result, expected)
 
 
+def test_cum_prod_series_float_no_nulls(
+    request: pytest.FixtureRequest, constructor_eager: ConstructorEager
+) -> None:
+    if PYARROW_VERSION < (13, 0, 0) and "pyarrow_table" in str(constructor_eager):
+        request.applymarker(pytest.mark.xfail)
+
+    if (PANDAS_VERSION < (2, 1) or PYARROW_VERSION < (13,)) and "pandas_pyarrow" in str(
+        constructor_eager
+    ):
+        request.applymarker(pytest.mark.xfail)
+
+    data = {"a": [1.5, 3.0, 0.5, 2.0]}
+    df = nw.from_native(constructor_eager(data), eager_only=True)
+    result = df.select(
+        cum_prod=df["a"].cum_prod(),
+        reverse_cum_prod=df["a"].cum_prod(reverse=True),
+    )
+    expected = {
+        "cum_prod": [1.5, 4.5, 2.25, 4.5],
+        "reverse_cum_prod": [4.5, 3.0, 1.0, 2.0],
+    }
+    assert_equal_data(result, expected)
+
+
 @pytest.mark.parametrize(
     ("reverse", "expected_a"),
     [
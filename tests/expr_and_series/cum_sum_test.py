@@ -228,6 +228,17 @@ def test_cum_sum_series(constructor_eager: ConstructorEager) -> None:
     assert_equal_data(result, expected)
 
 
+def test_cum_sum_series_float_no_nulls(constructor_eager: ConstructorEager) -> None:
+    data = {"arg entina": [1.5, 3.0, 0.5, 2.0]}
+    df = nw.from_native(constructor_eager(data), eager_only=True)
+    result = df.select(
+        cum_sum=df["arg entina"].cum_sum(),
+        reverse_cum_sum=df["arg entina"].cum_sum(reverse=True),
+    )
+    expected = {"cum_sum": [1.5, 4.5, 5.0, 7.0], "reverse_cum_sum": [7.0, 5.5, 2.5, 2.0]}
+    assert_equal_data(result, expected)
+
+
 def test_shift_cum_sum(constructor_eager: ConstructorEager) -> None:
     if "polars" in str(constructor_eager) and POLARS_VERSION < (1, 10):
         pytest.skip()
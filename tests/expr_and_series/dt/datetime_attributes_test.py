@@ -6,9 +6,11 @@ from datetime import datetime
 import pytest
 
 import narwhals as nw
+from tests.utils import PANDAS_VERSION
 from tests.utils import Constructor
 from tests.utils import ConstructorEager
 from tests.utils import assert_equal_data
+from tests.utils import is_windows
 
 data = {
     "a": [
@@ -128,3 +130,40 @@ def test_to_date(request: pytest.FixtureRequest, constructor: Constructor) -> No
         df = nw.from_native(constructor(dates))
     result = df.select(nw.col("a").dt.date())
     assert result.collect_schema() == {"a": nw.Date}
+
+
+def test_nanosecond_nulls_and_pre_epoch(constructor_eager: ConstructorEager) -> None:
+    data = {
+        "a": [
+            datetime(2021, 3, 1, 12, 34, 56, 49),
+            None,
+            datetime(1960, 1, 2, 2, 4, 14, 715000),
+        ]
+    }
+    df = nw.from_native(constructor_eager(data), eager_only=True)
+    result = df.select(df["a"].dt.nanosecond())
+    assert_equal_data(result, {"a": [49000, None, 715000000]})
+
+
+def test_weekday_nulls_pre_epoch_and_tz_aware(
+    request: pytest.FixtureRequest, constructor_eager: ConstructorEager
+) -> None:
+    if (
+        ("pyarrow" in str(constructor_eager) and is_windows())
+        or ("pyarrow_table" in str(constructor_eager) and is_windows())
+        or ("pandas_pyarrow" in str(constructor_eager) and PANDAS_VERSION < (2, 1))
+        or ("modin_pyarrow" in str(constructor_eager) and PANDAS_VERSION < (2, 1))
+    ):
+        pytest.skip()
+    if "cudf" in str(constructor_eager):
+        request.applymarker(pytest.mark.xfail)
+    data = {"a": [datetime(2021, 3, 1, 23, 30), None, datetime(1960, 1, 3)]}
+    df = nw.from_native(constructor_eager(data), eager_only=True)
+    result = df.select(
+        naive=df["a"].dt.weekday(),
+        aware=df["a"]
+        .dt.replace_time_zone("UTC")
+        .dt.convert_time_zone("Asia/Kathmandu")
+        .dt.weekday(),
+    )
+    assert_equal_data(result, {"naive": [1, None, 7], "aware": [2, None, 7]})
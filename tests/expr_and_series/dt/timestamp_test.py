@@ -181,6 +181,29 @@ def test_timestamp_dates(
     assert_equal_data(result, {"a": expected})
 
 
+@pytest.mark.parametrize(
+    ("time_unit", "expected"),
+    [
+        ("ns", [1614602096049000000, 1577930654715000000]),
+        ("us", [1614602096049000, 1577930654715000]),
+        ("ms", [1614602096049, 1577930654715]),
+    ],
+)
+def test_timestamp_datetimes_no_nulls(
+    request: pytest.FixtureRequest,
+    constructor: Constructor,
+    time_unit: Literal["ns", "us", "ms"],
+    expected: list[int],
+) -> None:
+    if any(x in str(constructor) for x in ("duckdb", "pyspark")):
+        request.applymarker(
+            pytest.mark.xfail(reason="Backend timestamp conversion not yet implemented")
+        )
+    df = nw.from_native(constructor(data))
+    result = df.select(nw.col("a").dt.timestamp(time_unit))
+    assert_equal_data(result, {"a": expected})
+
+
 def test_timestamp_invalid_date(
     request: pytest.FixtureRequest, constructor: Constructor
 ) -> None:
@@ -69,6 +69,7 @@ def test_is_first_distinct_expr_lazy_grouped(
 def test_is_first_distinct_series(constructor_eager: ConstructorEager) -> None:
     series = nw.from_native(constructor_eager(data), eager_only=True)["a"]
     result = series.is_first_distinct()
+    assert result.name == "a"
     expected = {
         "a": [True, False, True, True, False],
     }
@@ -106,6 +106,7 @@ def test_is_last_distinct_expr_lazy_grouped_nulls(
 def test_is_last_distinct_series(constructor_eager: ConstructorEager) -> None:
     series = nw.from_native(constructor_eager(data), eager_only=True)["a"]
     result = series.is_last_distinct()
+    assert result.name == "a"
     expected = {
         "a": [False, True, False, True, True],
     }
@@ -55,6 +55,7 @@ def test_is_unique_series(constructor_eager: ConstructorEager) -> None:
     }
     series = nw.from_native(constructor_eager(data), eager_only=True)["a"]
     result = series.is_unique()
+    assert result.name == "a"
     expected = {
         "a": [False, False, True],
     }
@@ -25,3 +25,12 @@ def test_expr_sum_series(
     series = nw.from_native(constructor_eager(data), eager_only=True)[col]
     result = series.sum()
     assert_equal_data({col: [result]}, {col: [expected]})
+
+
+def test_expr_sum_series_small_int_no_overflow(
+    constructor_eager: ConstructorEager,
+) -> None:
+    # The total doesn't fit in 32 bits, so small ints must be summed in 64 bits.
+    df = nw.from_native(constructor_eager({"a": [30_000] * 80_000}), eager_only=True)
+    result = df["a"].cast(nw.Int16).sum()
+    assert result == 2_400_000_000
@@ -33,35 +33,32 @@ TEST_EAGER_BACKENDS = [
 ]
 
 
+@pytest.fixture(scope="module")
+def csv_path(tmp_path_factory: pytest.TempPathFactory) -> str:
+    fp = tmp_path_factory.mktemp("data") / "file.csv"
+    pl.DataFrame(data).write_csv(fp)
+    return str(fp)
+
+
 @pytest.mark.parametrize("backend", TEST_EAGER_BACKENDS)
 @pytest.mark.parametrize("nw_namespace", [nw, nw_v1])
 def test_read_csv(
-    tmpdir: pytest.TempdirFactory,
-    backend: Implementation | str,
-    nw_namespace: ModuleType,
+    csv_path: str, backend: Implementation | str, nw_namespace: ModuleType
 ) -> None:
-    df_pl = pl.DataFrame(data)
-    filepath = str(tmpdir / "file.csv")  # type: ignore[operator]
-    df_pl.write_csv(filepath)
-    result = nw_namespace.read_csv(filepath, backend=backend)
+    result = nw_namespace.read_csv(csv_path, backend=backend)
     assert_equal_data(result, data)
     assert isinstance(result, nw_namespace.DataFrame)
 
 
 @pytest.mark.skipif(PANDAS_VERSION < (1, 5), reason="too old for pyarrow")
-def test_read_csv_kwargs(tmpdir: pytest.TempdirFactory) -> None:
-    df_pl = pl.DataFrame(data)
-    filepath = str(tmpdir / "file.csv")  # type: ignore[operator]
-    df_pl.write_csv(filepath)
-    result = nw.read_csv(filepath, backend=pd, engine="pyarrow")
+def test_read_csv_kwargs(csv_path: str) -> None:
+    result = nw.read_csv(csv_path, backend=pd, engine="pyarrow")
     assert_equal_data(result, data)
 
 
 @pytest.mark.parametrize("nw_namespace", [nw, nw_v1])
 def test_scan_csv(
-    tmpdir: pytest.TempdirFactory,
-    constructor: Constructor,
-    nw_namespace: ModuleType,
+    csv_path: str, constructor: Constructor, nw_namespace: ModuleType
 ) -> None:
     kwargs: dict[str, Any]
     if "sqlframe" in str(constructor):
@@ -91,22 +88,16 @@ def test_scan_csv(
     else:
         kwargs = {}
 
-    df_pl = pl.DataFrame(data)
-    filepath = str(tmpdir / "file.csv")  # type: ignore[operator]
-    df_pl.write_csv(filepath)
     df = nw_namespace.from_native(constructor(data))
     backend = nw_namespace.get_native_namespace(df)
-    result = nw_namespace.scan_csv(filepath, backend=backend, **kwargs)
+    result = nw_namespace.scan_csv(csv_path, backend=backend, **kwargs)
     assert_equal_data(result, data)
     assert isinstance(result, nw_namespace.LazyFrame)
 
 
 @pytest.mark.skipif(PANDAS_VERSION < (1, 5), reason="too old for pyarrow")
-def test_scan_csv_kwargs(tmpdir: pytest.TempdirFactory) -> None:
-    df_pl = pl.DataFrame(data)
-    filepath = str(tmpdir / "file.csv")  # type: ignore[operator]
-    df_pl.write_csv(filepath)
-    result = nw.scan_csv(filepath, backend=pd, engine="pyarrow")
+def test_scan_csv_kwargs(csv_path: str) -> None:
+    result = nw.scan_csv(csv_path, backend=pd, engine="pyarrow")
     assert_equal_data(result, data)
 
 